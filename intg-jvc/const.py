@@ -5,9 +5,10 @@ from enum import StrEnum
 from typing import Any, Final
 
 from jvcprojector import command
+from ucapi import media_player
 
 
-@dataclass
+@dataclass(slots=True)
 class JVCConfig:
     """JVC device configuration."""
 
@@ -61,6 +62,18 @@ class SelectConfig:
     """List of valid options (populated at runtime from projector spec)."""
 
 
+@dataclass(frozen=True, slots=True)
+class CommandConfig:
+    """Projector command triggered by a media player or remote command."""
+
+    verb: str
+    """JVCProjector.send_command verb (e.g., 'operation')."""
+    kwargs: dict[str, Any]
+    """Keyword arguments for the verb."""
+    background: bool = False
+    """Run without waiting for the projector, for commands that take a long time."""
+
+
 # Map of command class names to sensor configurations
 # Filtered at runtime based on what the connected projector actually supports
 SENSORS: Final[dict[str, SensorConfig]] = {
@@ -203,6 +216,100 @@ class SimpleCommands(StrEnum):
     REMOTE_HIDE = "Hide"
 
 
+def _remote(code: str) -> CommandConfig:
+    """Return a command entry that sends a remote key code."""
+    return CommandConfig("remote", {"code": code})
+
+
+def _operation(cmd_class: Any, value: Any, background: bool = False) -> CommandConfig:
+    """Return a command entry that sets a projector operation to a value."""
+    return CommandConfig("operation", {"cmd_class": cmd_class, "value": value}, background)
+
+
+# Map of standard media-player commands to the projector command they trigger
+BASIC_COMMAND_MAP: Final[dict[str, CommandConfig]] = {
+    media_player.Commands.ON: CommandConfig("powerOn", {}),
+    media_player.Commands.OFF: CommandConfig("powerOff", {}),
+    media_player.Commands.TOGGLE: CommandConfig("powerToggle", {}),
+    media_player.Commands.CURSOR_UP: _remote(command.Remote.UP),
+    media_player.Commands.CURSOR_DOWN: _remote(command.Remote.DOWN),
+    media_player.Commands.CURSOR_LEFT: _remote(command.Remote.LEFT),
+    media_player.Commands.CURSOR_RIGHT: _remote(command.Remote.RIGHT),
+    media_player.Commands.CURSOR_ENTER: _remote(command.Remote.OK),
+    media_player.Commands.BACK: _remote(command.Remote.BACK),
+    media_player.Commands.INFO: _remote(command.Remote.INFO),
+    media_player.Commands.MENU: _remote(command.Remote.MENU),
+}
+
+# Map of simple commands to the projector command they trigger.
+# Lens memory recalls take a long time, so they run in the background to avoid timing out.
+SIMPLE_COMMAND_MAP: Final[dict[str, CommandConfig]] = {
+    **{
+        SimpleCommands[f"LENS_MEMORY_{memory}"]: _operation(
+            command.InstallationMode, getattr(command.InstallationMode, f"MEMORY_{memory}"), background=True
+        )
+        for memory in range(1, 11)
+    },
+    SimpleCommands.PICTURE_MODE_FILM: _operation(command.PictureMode, command.PictureMode.FILM),
+    SimpleCommands.PICTURE_MODE_CINEMA: _operation(command.PictureMode, command.PictureMode.CINEMA),
+    SimpleCommands.PICTURE_MODE_NATURAL: _operation(command.PictureMode, command.PictureMode.NATURAL),
+    SimpleCommands.PICTURE_MODE_HDR10: _operation(command.PictureMode, command.PictureMode.HDR10),
+    SimpleCommands.PICTURE_MODE_THX: _operation(command.PictureMode, command.PictureMode.THX),
+    SimpleCommands.PICTURE_MODE_USER1: _operation(command.PictureMode, command.PictureMode.USER_1),
+    SimpleCommands.PICTURE_MODE_USER2: _operation(command.PictureMode, command.PictureMode.USER_2),
+    SimpleCommands.PICTURE_MODE_USER3: _operation(command.PictureMode, command.PictureMode.USER_3),
+    SimpleCommands.PICTURE_MODE_USER4: _operation(command.PictureMode, command.PictureMode.USER_4),
+    SimpleCommands.PICTURE_MODE_USER5: _operation(command.PictureMode, command.PictureMode.USER_5),
+    SimpleCommands.PICTURE_MODE_USER6: _operation(command.PictureMode, command.PictureMode.USER_6),
+    SimpleCommands.PICTURE_MODE_HLG: _operation(command.PictureMode, command.PictureMode.HLG),
+    SimpleCommands.PICTURE_MODE_FRAME_ADAPT_HDR: _operation(command.PictureMode, command.PictureMode.FRAME_ADAPT_HDR),
+    SimpleCommands.PICTURE_MODE_HDR10P: _operation(command.PictureMode, command.PictureMode.HDR10_PLUS),
+    SimpleCommands.PICTURE_MODE_PANA_PQ: _operation(command.PictureMode, command.PictureMode.PANA_PQ),
+    SimpleCommands.LOW_LATENCY_ON: _operation(command.LowLatencyMode, command.LowLatencyMode.ON),
+    SimpleCommands.LOW_LATENCY_OFF: _operation(command.LowLatencyMode, command.LowLatencyMode.OFF),
+    SimpleCommands.MASK_OFF: _operation(command.Mask, command.Mask.OFF),
+    SimpleCommands.MASK_CUSTOM1: _operation(command.Mask, command.Mask.CUSTOM_1),
+    SimpleCommands.MASK_CUSTOM2: _operation(command.Mask, command.Mask.CUSTOM_2),
+    SimpleCommands.MASK_CUSTOM3: _operation(command.Mask, command.Mask.CUSTOM_3),
+    SimpleCommands.LAMP_LOW: _operation(command.LightPower, command.LightPower.LOW),
+    SimpleCommands.LAMP_MID: _operation(command.LightPower, command.LightPower.MID),
+    SimpleCommands.LAMP_HIGH: _operation(command.LightPower, command.LightPower.HIGH),
+    SimpleCommands.LENS_APERTURE_OFF: _operation(command.IntelligentLensAperture, command.IntelligentLensAperture.OFF),
+    SimpleCommands.LENS_APERTURE_AUTO1: _operation(
+        command.IntelligentLensAperture, command.IntelligentLensAperture.AUTO_1
+    ),
+    SimpleCommands.LENS_APERTURE_AUTO2: _operation(
+        command.IntelligentLensAperture, command.IntelligentLensAperture.AUTO_2
+    ),
+    SimpleCommands.LENS_ANIMORPHIC_OFF: _operation(command.Anamorphic, command.Anamorphic.OFF),
+    SimpleCommands.LENS_ANIMORPHIC_A: _operation(command.Anamorphic, command.Anamorphic.A),
+    SimpleCommands.LENS_ANIMORPHIC_B: _operation(command.Anamorphic, command.Anamorphic.B),
+    SimpleCommands.LENS_ANIMORPHIC_C: _operation(command.Anamorphic, command.Anamorphic.C),
+    SimpleCommands.LENS_ANIMORPHIC_D: _operation(command.Anamorphic, command.Anamorphic.D),
+    SimpleCommands.CONTENT_TYPE_AUTO: _operation(command.ContentType, command.ContentType.AUTO),
+    SimpleCommands.CONTENT_TYPE_SDR: _operation(command.ContentType, command.ContentType.SDR),
+    SimpleCommands.CONTENT_TYPE_HDR10: _operation(command.ContentType, command.ContentType.HDR10),
+    SimpleCommands.CONTENT_TYPE_HDR10P: _operation(command.ContentType, command.ContentType.HDR10_PLUS),
+    SimpleCommands.CONTENT_TYPE_HLG: _operation(command.ContentType, command.ContentType.HLG),
+    SimpleCommands.REMOTE_ADVANCED_MENU: _remote(command.Remote.ADVANCED_MENU),
+    SimpleCommands.REMOTE_PICTURE_MODE: _remote(command.Remote.PICTURE_MODE),
+    SimpleCommands.REMOTE_COLOR_PROFILE: _remote(command.Remote.COLOR_PROFILE),
+    SimpleCommands.REMOTE_LENS_CONTROL: _remote(command.Remote.LENS_CONTROL),
+    SimpleCommands.REMOTE_SETTING_MEMORY: _remote(command.Remote.SETTING_MEMORY),
+    SimpleCommands.REMOTE_GAMMA_SETTINGS: _remote(command.Remote.GAMMA_SETTINGS),
+    SimpleCommands.REMOTE_CMD: _remote(command.Remote.CMD),
+    SimpleCommands.REMOTE_MODE_1: _remote(command.Remote.MODE_1),
+    SimpleCommands.REMOTE_MODE_2: _remote(command.Remote.MODE_2),
+    SimpleCommands.REMOTE_MODE_3: _remote(command.Remote.MODE_3),
+    SimpleCommands.REMOTE_LENS_AP: _remote(command.Remote.LENS_APERTURE),
+    SimpleCommands.REMOTE_ANAMO: _remote(command.Remote.ANAMORPHIC),
+    SimpleCommands.REMOTE_GAMMA: _remote(command.Remote.GAMMA),
+    SimpleCommands.REMOTE_COLOR_TEMP: _remote(command.Remote.COLOR_TEMP),
+    SimpleCommands.REMOTE_3D_FORMAT: _remote(command.Remote.V3D_FORMAT),
+    SimpleCommands.REMOTE_PIC_ADJ: _remote(command.Remote.PICTURE_ADJUST),
+    SimpleCommands.REMOTE_HIDE: _remote(command.Remote.HIDE),
+}
+
 # Map of command class names to select configurations
 # Options are populated at runtime based on projector spec
 SELECTS: Final[dict[str, SelectConfig]] = {
@@ -5,6 +5,7 @@ This module implements the JVC Projector communication of the Remote Two/3 integ
 
 import asyncio
 import logging
+import time
 from asyncio import AbstractEventLoop
 from copy import copy
 from typing import Any
@@ -12,9 +13,13 @@ from typing import Any
 from const import SELECTS, SENSORS, JVCConfig, SelectConfig, SensorConfig
 from jvcprojector import JvcProjector
 from jvcprojector import command as jvc_cmd
+from jvcprojector import device as jvc_device
 from jvcprojector.command.base import Command as JvcCommand
 from jvcprojector.command.command import SPECIFICATIONS
+from jvcprojector.connection import Connection as JvcConnection
 from jvcprojector.error import JvcProjectorError
+from remote_keys import RemoteKeyQueue
+from session import tune_new_connections, with_retry
 from ucapi import EntityTypes, media_player
 from ucapi.select import States as SelectStates
 from ucapi.sensor import States as SensorStates
@@ -34,8 +39,19 @@ from ucapi_framework.helpers import (
 _LOG = logging.getLogger(__name__)
 
 SENSOR_POLL_INTERVAL = 30
+SENSOR_POLL_MAX_INTERVAL = 120
 SOURCE_SETTLE_DELAY = 5
 WARMUP_SENSOR_DELAY = 60
+CONNECTION_IDLE_TIMEOUT = 5.0
+POWER_STATE_TTL = 2.0
+
+# pyjvcprojector closes its socket 0.5s after every command, so each button press paid
+# a new TCP connect plus PJREQ handshake. Keep the session open long enough to cover
+# bursts of presses while still freeing the projector's single control connection for
+# other controllers once idle. pyjvcprojector 2.0.6 (pinned in requirements.txt) has no
+# option for this; Device.send() reads the module-level KEEPALIVE_TTL on every command,
+# so it is set once here for the driver process. Recheck when upgrading the library.
+jvc_device.KEEPALIVE_TTL = CONNECTION_IDLE_TIMEOUT  # type: ignore[misc]
 
 
 class JVCProjector(ExternalClientDevice):
@@ -64,11 +80,16 @@ class JVCProjector(ExternalClientDevice):
         )
         self._projector_lock = asyncio.Lock()
         self._sensor_poll_task: asyncio.Task | None = None
-        self._source_update_task: asyncio.Task | None = None
-        self._warmup_update_task: asyncio.Task | None = None
+        self._sensor_update_handle: asyncio.TimerHandle | None = None
+        self._sensor_update_task: asyncio.Task | None = None
+        self._background_tasks: set[asyncio.Task] = set()
+        self._remote_keys = RemoteKeyQueue(self._send_queued_key, self.name)
         self._source_list: list[str] = ["HDMI1", "HDMI2"]
         self._capabilities: dict[str, Any] = {}
         self._capabilities_retrieved = False
+        self._tuned_connection: JvcConnection | None = None
+        self._power_cache: tuple[media_player.States, float] | None = None
+        self._published_state: dict[str, Any] = {}
 
         # Initialize empty sensor and select config dicts (metadata only, not runtime state)
         self.sensors: dict[str, SensorConfig] = {}
@@ -135,7 +156,6 @@ class JVCProjector(ExternalClientDevice):
 
     async def create_client(self) -> Any:
         """Create the JVC projector client instance."""
-
         return JvcProjector(
             host=self._device_config.address,
             password=self._device_config.password,
@@ -151,8 +171,9 @@ class JVCProjector(ExternalClientDevice):
                 self.address,
             )
             await self._client.connect()
+            self._install_socket_tuning()
             _LOG.debug("[%s] Connection established successfully", self.name)
-        except JvcProjectorError as err:
+        except (JvcProjectorError, OSError) as err:
             _LOG.error(
                 "[%s] Failed to connect to projector: %s",
                 self.name,
@@ -160,13 +181,12 @@ class JVCProjector(ExternalClientDevice):
             )
             raise
 
-        # Get initial power state
+        # Get initial power state and, if on, the active input
         try:
             _LOG.debug("[%s] Querying power state", self.name)
-            power_str = await self._client.get(jvc_cmd.Power)
-            self._state_values["power"] = self._convert_power_state(str(power_str))
+            await self._refresh_power_and_input()
             _LOG.debug("[%s] Power state: %s", self.name, self._state_values["power"])
-        except JvcProjectorError as err:
+        except (JvcProjectorError, OSError) as err:
             _LOG.error(
                 "[%s] Failed to get power state: %s",
                 self.name,
@@ -206,13 +226,6 @@ class JVCProjector(ExternalClientDevice):
                 ]
                 self.driver.add_entities(select_entities)  # type: ignore[arg-type]
 
-        # Get input if projector is on
-        if self._state_values["power"] == media_player.States.ON:
-            async with self._projector_lock:
-                input_value = await self._client.get(jvc_cmd.Input)
-                if input_value:
-                    self._state_values["input"] = input_value.upper()
-
         # Keep configured sensors current while the projector is connected.
         if (
             self._has_configured_sensors()
@@ -220,19 +233,63 @@ class JVCProjector(ExternalClientDevice):
         ):
             self._sensor_poll_task = asyncio.create_task(self._poll_sensors())
 
-        self.push_update()
+        self._remote_keys.start()
+
+        self._push_state_changes(force=True)
+
+    async def _refresh_power_and_input(self) -> None:
+        """Read the power state and, when on, the active input in one lock hold.
+
+        Both reads share the single projector session, which serializes them on the
+        wire, so they are issued back to back rather than gathered. Holding the lock
+        across both keeps a sensor poll or command from slipping in between.
+        """
+        async with self._projector_lock:
+            self._power_cache = None
+            self._state_values["power"] = await self._get_power_state()
+            if self._state_values["power"] == media_player.States.ON:
+                input_value = await self._query(jvc_cmd.Input)
+                if input_value:
+                    self._state_values["input"] = input_value.upper()
+
+    async def _get_power_state(self) -> media_player.States:
+        """Return the projector power state, reusing a reading from the last few seconds.
+
+        Power commands check the current state before acting, so a toggle shortly after
+        a refresh or another power command would otherwise cost an extra round-trip.
+        """
+        if self._power_cache is not None:
+            state, read_at = self._power_cache
+            if time.monotonic() - read_at < POWER_STATE_TTL:
+                return state
+
+        power = await self._query(jvc_cmd.Power)
+        # Normalize power state from API
+        state = self._convert_power_state(str(power))
+        self._cache_power_state(state)
+        return state
+
+    def _cache_power_state(self, state: media_player.States) -> None:
+        """Remember the power state last read from or sent to the projector."""
+        self._power_cache = (state, time.monotonic())
 
     async def disconnect_client(self) -> None:
         """Disconnect from the JVC projector."""
         await self._cancel_task(self._sensor_poll_task)
-        await self._cancel_task(self._source_update_task)
-        await self._cancel_task(self._warmup_update_task)
+        if self._sensor_update_handle is not None:
+            self._sensor_update_handle.cancel()
+        await self._cancel_task(self._sensor_update_task)
+        await self._remote_keys.stop()
+        for task in list(self._background_tasks):
+            await self._cancel_task(task)
         self._sensor_poll_task = None
-        self._source_update_task = None
-        self._warmup_update_task = None
+        self._sensor_update_handle = None
+        self._sensor_update_task = None
+        self._power_cache = None
 
-        # JvcLib doesn't have an explicit disconnect method
-        # The connection is managed internally
+        # Close the kept-alive projector session instead of waiting for it to idle out
+        if self._client is not None:
+            await self._client.disconnect()
         _LOG.debug("[%s] Disconnected from projector", self.name)
 
     def check_client_connected(self) -> bool:
@@ -241,6 +298,56 @@ class JVCProjector(ExternalClientDevice):
         # Return True if client exists; watchdog will detect issues when commands fail
         return self._client is not None
 
+    async def _query(self, command_class: Any) -> str:
+        """Read a value from the projector over the shared projector session.
+
+        The underlying client reconnects lazily when the kept-alive session has idled
+        out or was dropped after an error, so callers never manage the socket. A
+        session the projector closed on its own is dropped first (see _drop_closed_session).
+        """
+        await self._drop_closed_session()
+        return await with_retry(self.name, self._client.get, command_class)
+
+    async def _operate(self, command_class: Any, value: Any) -> None:
+        """Write a value to the projector over the shared projector session.
+
+        Remote key presses are not idempotent, so they are not resent when the
+        projector may already have received them (read timeout after the write).
+        """
+        await self._drop_closed_session()
+        await with_retry(
+            self.name,
+            self._client.set,
+            command_class,
+            value,
+            idempotent=command_class is not jvc_cmd.Remote,
+        )
+
+    async def _drop_closed_session(self) -> None:
+        """Disconnect a kept-alive session the projector has already closed.
+
+        The client only checks that it still holds a stream, so it would write to a
+        socket the projector hung up on and fail with an empty ack that is not worth
+        retrying. Disconnecting first makes it open a fresh session instead.
+        """
+        device = getattr(self._client, "_device", None)
+        reader = getattr(getattr(device, "_conn", None), "_reader", None)
+        if reader is None or not reader.at_eof():
+            return
+        _LOG.debug("[%s] Projector closed the idle session, reconnecting", self.name)
+        await device.disconnect()
+
+    def _install_socket_tuning(self) -> None:
+        """Apply socket options to every connection the client opens (see tune_new_connections)."""
+        conn = getattr(getattr(self._client, "_device", None), "_conn", None)
+        if conn is self._tuned_connection:
+            return
+        if not isinstance(conn, JvcConnection):
+            _LOG.debug("[%s] Unexpected projector client internals; socket options not set", self.name)
+            return
+        tune_new_connections(conn, self.name)
+        self._tuned_connection = conn
+
     # ─────────────────────────────────────────────────────────────────
     # Device command handling
     # ─────────────────────────────────────────────────────────────────
@@ -265,75 +372,65 @@ class JVCProjector(ExternalClientDevice):
                 kwargs,
             )
 
+            # Remote keys are serialized by the writer queue, which takes the lock itself
+            if command == "remote":
+                await self._send_remote_key(kwargs.get("code"))
+                return
+
             # Acquire lock to serialize access to projector
             async with self._projector_lock:
                 match command:
                     case "powerOn":
-                        power = await self._client.get(jvc_cmd.Power)
-                        # Normalize power state from API
-                        power_state = self._convert_power_state(str(power))
+                        power_state = await self._get_power_state()
                         if power_state in [
                             media_player.States.STANDBY,
                             media_player.States.OFF,
                         ]:
-                            await self._client.set(jvc_cmd.Power, jvc_cmd.Power.ON)
+                            await self._operate(jvc_cmd.Power, jvc_cmd.Power.ON)
+                            self._cache_power_state(media_player.States.ON)
+                            # Delay sensor updates for 60 seconds to allow projector to warm up
+                            self._schedule_warmup_sensor_update()
                         self._state_values["power"] = media_player.States.ON
-                        self.push_update()
-                        # Delay sensor updates for 60 seconds to allow projector to warm up
-                        self._schedule_warmup_sensor_update()
+                        self._push_state_changes()
                     case "powerOff":
-                        power = await self._client.get(jvc_cmd.Power)
-                        # Normalize power state from API
-                        power_state = self._convert_power_state(str(power))
+                        power_state = await self._get_power_state()
                         if power_state == media_player.States.ON:
-                            await self._client.set(jvc_cmd.Power, jvc_cmd.Power.OFF)
+                            await self._operate(jvc_cmd.Power, jvc_cmd.Power.OFF)
+                            self._cache_power_state(media_player.States.STANDBY)
                         self._state_values["power"] = media_player.States.STANDBY
-                        self.push_update()
+                        self._push_state_changes()
                         await self._update_all_sensors()
                     case "powerToggle":
-                        power = await self._client.get(jvc_cmd.Power)
-                        # Normalize power state from API
-                        power_state = self._convert_power_state(str(power))
+                        power_state = await self._get_power_state()
                         if power_state == media_player.States.ON:
-                            await self._client.set(jvc_cmd.Power, jvc_cmd.Power.OFF)
+                            await self._operate(jvc_cmd.Power, jvc_cmd.Power.OFF)
+                            self._cache_power_state(media_player.States.STANDBY)
                             self._state_values["power"] = media_player.States.STANDBY
-                            self.push_update()
+                            self._push_state_changes()
                             await self._update_all_sensors()
                         elif power_state in [
                             media_player.States.STANDBY,
                             media_player.States.OFF,
                         ]:
-                            await self._client.set(jvc_cmd.Power, jvc_cmd.Power.ON)
+                            await self._operate(jvc_cmd.Power, jvc_cmd.Power.ON)
+                            self._cache_power_state(media_player.States.ON)
                             self._state_values["power"] = media_player.States.ON
-                            self.push_update()
+                            self._push_state_changes()
                             self._schedule_warmup_sensor_update()
                         else:
                             self._state_values["power"] = power_state
-                            self.push_update()
+                            self._push_state_changes()
 
                     case "setInput":
                         source = (kwargs.get("source") or "HDMI1").upper()
                         remote_cmd = jvc_cmd.Remote.HDMI1  # Default to HDMI1
                         if source == "HDMI2":
                             remote_cmd = jvc_cmd.Remote.HDMI2
-                        await self._client.remote(remote_cmd)
+                        await self._operate(jvc_cmd.Remote, remote_cmd)
                         self._state_values["input"] = source
-                        self.push_update()
+                        self._push_state_changes()
                         self._schedule_source_update()
 
-                    case "remote":
-                        code = kwargs.get("code")
-                        if code:
-                            # For Remote commands, just check if Remote class is supported
-                            # Individual remote values don't need separate support checks
-                            if not self._client.supports(jvc_cmd.Remote):
-                                _LOG.warning(
-                                    "[%s] Remote commands not supported",
-                                    self.name,
-                                )
-                                return
-                            await self._client.remote(code)
-
                     case "operation":
                         cmd_class = kwargs.get("cmd_class")
                         value = kwargs.get("value")
@@ -347,14 +444,14 @@ class JVCProjector(ExternalClientDevice):
                                 )
                                 return
 
-                            await self._client.set(cmd_class, value)
+                            await self._operate(cmd_class, value)
 
                             # Single write covers sensor, select, and any other entity
                             # sharing the same key in _state_values
                             for sensor_id, sensor_config in self.sensors.items():
                                 if sensor_config.query_command == cmd_class:
                                     self._state_values[sensor_id] = str(value)
-                                    self.push_update()
+                                    self._push_state_changes()
                                     break
 
                     case _:
@@ -368,7 +465,8 @@ class JVCProjector(ExternalClientDevice):
                 err,
             )
             raise
-        except JvcProjectorError as err:  # pylint: disable=broad-exception-caught
+        except (JvcProjectorError, OSError) as err:
+            self._power_cache = None
             _LOG.error(
                 "[%s] Error sending command %s: %s",
                 self.name,
@@ -377,6 +475,47 @@ class JVCProjector(ExternalClientDevice):
             )
             raise
 
+    def spawn_command(self, command: str, **kwargs: Any) -> None:
+        """Send a command without waiting for it to finish.
+
+        Used for commands that outlast the Remote's command timeout, such as lens
+        memory recalls. The task is kept referenced until it completes and cancelled
+        on disconnect; failures are logged by send_command.
+
+        :param command: Command to send
+        :param kwargs: Keyword arguments
+        """
+        task = asyncio.create_task(self.send_command(command, **kwargs))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_task_done)
+
+    def _background_task_done(self, task: asyncio.Task) -> None:
+        """Forget a finished background command and consume its exception."""
+        self._background_tasks.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    async def _send_remote_key(self, code: str | None) -> None:
+        """Queue a remote key press and wait until it has been sent."""
+        if not code:
+            return
+
+        # For Remote commands, just check if Remote class is supported
+        # Individual remote values don't need separate support checks
+        if not self._client.supports(jvc_cmd.Remote):
+            _LOG.warning("[%s] Remote commands not supported", self.name)
+            return
+
+        if self._remote_keys.running:
+            await self._remote_keys.send(code)
+        else:
+            await self._send_queued_key(code)
+
+    async def _send_queued_key(self, code: str) -> None:
+        """Send one remote key press, taking the projector lock for it."""
+        async with self._projector_lock:
+            await self._operate(jvc_cmd.Remote, code)
+
     async def discover_capabilities(self) -> None:
         """Discover projector capabilities and build dynamic sensor/select lists.
 
@@ -545,12 +684,12 @@ class JVCProjector(ExternalClientDevice):
         select_config = self.selects[select_id]
         try:
             async with self._projector_lock:
-                await self._client.set(select_config.command_class, option)
+                await self._operate(select_config.command_class, option)
             self._state_values[select_id] = option
-            self.push_update()
+            self._push_state_changes()
             _LOG.info("[%s] Select '%s' set to: %s", self.name, select_id, option)
             return True
-        except JvcProjectorError as err:
+        except (JvcProjectorError, OSError) as err:
             _LOG.error(
                 "[%s] Failed to set select '%s' to '%s': %s",
                 self.name,
@@ -603,7 +742,7 @@ class JVCProjector(ExternalClientDevice):
                                 self._state_values[sensor_id] = str(value)
 
                                 await asyncio.sleep(0.25)
-                            except JvcProjectorError as err:
+                            except (JvcProjectorError, OSError) as err:
                                 _LOG.warning(
                                     "[%s] Error querying sensor '%s': %s",
                                     self.name,
@@ -619,17 +758,29 @@ class JVCProjector(ExternalClientDevice):
                 )
 
             # Push a single update to notify all subscribed entities
-            self.push_update()
+            self._push_state_changes()
 
         except Exception as err:  # noqa: BLE001
             _LOG.error("[%s] Error updating sensors: %s", self.name, err)
 
     async def _poll_sensors(self) -> None:
-        """Periodically refresh configured sensor values."""
+        """Periodically refresh configured sensor values.
+
+        The interval doubles, up to SENSOR_POLL_MAX_INTERVAL, for as long as nothing
+        changes between polls and drops back to SENSOR_POLL_INTERVAL after any change.
+        """
+        interval = SENSOR_POLL_INTERVAL
+        previous_values: dict[str, Any] | None = None
         try:
             while True:
-                await self._update_all_sensors()
-                await asyncio.sleep(SENSOR_POLL_INTERVAL)
+                # Join a delayed sweep that is already running instead of querying twice
+                await asyncio.shield(self._refresh_sensors())
+                if self._state_values == previous_values:
+                    interval = min(interval * 2, SENSOR_POLL_MAX_INTERVAL)
+                else:
+                    interval = SENSOR_POLL_INTERVAL
+                previous_values = dict(self._state_values)
+                await asyncio.sleep(interval)
         except asyncio.CancelledError:
             _LOG.debug("[%s] Sensor polling stopped", self.name)
             raise
@@ -666,14 +817,14 @@ class JVCProjector(ExternalClientDevice):
     async def _get_sensor_value(self, sensor_config: SensorConfig) -> str:
         """Query a sensor value, applying a timeout override when configured."""
         if sensor_config.query_timeout is None:
-            return str(await self._client.get(sensor_config.query_command))
+            return str(await self._query(sensor_config.query_command))
 
         device = getattr(self._client, "_device", None)
         conn = getattr(device, "_conn", None)
         if conn is None or not hasattr(conn, "_timeout"):
             return str(
                 await asyncio.wait_for(
-                    self._client.get(sensor_config.query_command),
+                    self._query(sensor_config.query_command),
                     timeout=sensor_config.query_timeout,
                 )
             )
@@ -681,36 +832,63 @@ class JVCProjector(ExternalClientDevice):
         original_timeout = conn._timeout
         conn._timeout = sensor_config.query_timeout
         try:
-            return str(await self._client.get(sensor_config.query_command))
+            return str(await self._query(sensor_config.query_command))
         finally:
             conn._timeout = original_timeout
 
-    async def _delayed_sensor_update(self, delay: int) -> None:
-        """Update sensors after a delay.
+    def _schedule_sensor_update(self, delay: int) -> None:
+        """Refresh sensors once, after every pending reason to wait has passed.
+
+        Warm-up and input changes both ask for a sweep once the projector has settled.
+        Requests that arrive while a refresh is pending are merged into it, moving it
+        later if needed, so back-to-back requests cost one sweep instead of one each.
 
         Args:
             delay: Delay in seconds before updating sensors
         """
-        _LOG.debug(
-            "[%s] Delaying sensor update for %d seconds (projector warming up)",
-            self.name,
-            delay,
-        )
-        await asyncio.sleep(delay)
+        loop = asyncio.get_running_loop()
+        when = loop.time() + delay
+        if self._sensor_update_handle is not None:
+            if self._sensor_update_handle.when() >= when:
+                return
+            self._sensor_update_handle.cancel()
+
+        _LOG.debug("[%s] Delaying sensor update for %d seconds", self.name, delay)
+        self._sensor_update_handle = loop.call_at(when, self._start_sensor_update)
+
+    def _start_sensor_update(self) -> None:
+        """Run a scheduled sensor update unless one is already in progress."""
+        self._sensor_update_handle = None
         _LOG.debug("[%s] Starting delayed sensor update", self.name)
-        await self._update_all_sensors()
+        self._refresh_sensors()
+
+    def _refresh_sensors(self) -> asyncio.Task:
+        """Start a sensor sweep, or return the sweep that is already in flight."""
+        if self._sensor_update_task is None or self._sensor_update_task.done():
+            self._sensor_update_task = asyncio.create_task(self._update_all_sensors())
+        return self._sensor_update_task
 
     def _schedule_source_update(self) -> None:
         """Refresh signal information after an input change has settled."""
-        if self._source_update_task and not self._source_update_task.done():
-            self._source_update_task.cancel()
-        self._source_update_task = asyncio.create_task(self._delayed_sensor_update(SOURCE_SETTLE_DELAY))
+        self._schedule_sensor_update(SOURCE_SETTLE_DELAY)
 
     def _schedule_warmup_sensor_update(self) -> None:
         """Refresh sensors after the projector has warmed up."""
-        if self._warmup_update_task and not self._warmup_update_task.done():
-            self._warmup_update_task.cancel()
-        self._warmup_update_task = asyncio.create_task(self._delayed_sensor_update(WARMUP_SENSOR_DELAY))
+        self._schedule_sensor_update(WARMUP_SENSOR_DELAY)
+
+    def _push_state_changes(self, force: bool = False) -> None:
+        """Notify subscribed entities, skipping the update if no state value changed.
+
+        Every push makes each entity re-read its attributes, so repeated presses that
+        leave the projector as it was (e.g. ON while already on) don't fan out again.
+
+        Args:
+            force: Push even if the state matches the last pushed snapshot
+        """
+        if not force and self._state_values == self._published_state:
+            return
+        self._published_state = dict(self._state_values)
+        self.push_update()
 
     @staticmethod
     async def _cancel_task(task: asyncio.Task | None) -> None:
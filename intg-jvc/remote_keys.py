@@ -0,0 +1,125 @@
+"""
+Remote key press queue of the JVC integration driver.
+
+Sends remote key presses to the projector one at a time and merges the repeats of a held key.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from jvcprojector.error import JvcProjectorError
+
+_LOG = logging.getLogger(__name__)
+
+REMOTE_QUEUE_SIZE = 16
+# Identical presses queued closer together than this come from a held key, not separate taps
+REMOTE_REPEAT_WINDOW = 0.15
+# The projector drops key presses that follow the previous one too closely
+REMOTE_KEY_INTERVAL = 0.4
+
+
+class RemoteKeyQueue:
+    """Send remote key presses one at a time from a bounded queue.
+
+    The projector needs about 400 ms between commands and pyjvcprojector 2.0.6 does
+    not pace operations itself, so presses are sent at least REMOTE_KEY_INTERVAL
+    apart. Presses of a held key therefore pile up faster than they can be sent.
+    Presses of the same key that arrived within REMOTE_REPEAT_WINDOW of each other
+    are repeats of a held key and are sent once, which keeps a menu from scrolling
+    on long after the key was released. Separate taps, such as stepping down three
+    menu rows, arrive further apart and are each sent.
+    """
+
+    def __init__(self, send: Callable[[str], Awaitable[None]], name: str) -> None:
+        """Create the queue; send is called with each key code to transmit."""
+        self._send = send
+        self._name = name
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future, float]] = asyncio.Queue(REMOTE_QUEUE_SIZE)
+        self._writer_task: asyncio.Task | None = None
+        self._last_sent = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Return whether the writer is running and will send queued presses."""
+        return self._writer_task is not None and not self._writer_task.done()
+
+    def start(self) -> None:
+        """Start the writer unless it is already running."""
+        if not self.running:
+            self._writer_task = asyncio.create_task(self._write())
+
+    async def stop(self) -> None:
+        """Stop the writer and fail the presses that were still waiting."""
+        task, self._writer_task = self._writer_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self._fail_pending()
+
+    async def send(self, code: str) -> None:
+        """Queue a key press and wait until it has been sent."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        # A full queue holds back further presses until the writer catches up
+        await self._queue.put((code, future, time.monotonic()))
+        if not self.running:
+            # Stopped while waiting for room; nothing will send the press now
+            self._fail_pending()
+        await future
+
+    async def _write(self) -> None:
+        """Send queued presses, merging the repeats of a held key."""
+        futures: list[asyncio.Future] = []
+        next_item: tuple[str, asyncio.Future, float] | None = None
+        try:
+            while True:
+                code, future, queued_at = next_item or await self._queue.get()
+                next_item = None
+                futures = [future]
+                wait = self._last_sent + REMOTE_KEY_INTERVAL - time.monotonic()
+                if wait > 0:
+                    # Repeats that arrive meanwhile are merged into this press
+                    await asyncio.sleep(wait)
+                while not self._queue.empty():
+                    item = self._queue.get_nowait()
+                    if item[0] != code or item[2] - queued_at > REMOTE_REPEAT_WINDOW:
+                        next_item = item
+                        break
+                    futures.append(item[1])
+                    queued_at = item[2]
+
+                if len(futures) > 1:
+                    _LOG.debug("[%s] Coalesced %d presses of %s", self._name, len(futures), code)
+
+                try:
+                    await self._send(code)
+                except (JvcProjectorError, OSError) as err:
+                    _resolve(futures, err)
+                else:
+                    _resolve(futures)
+                finally:
+                    self._last_sent = time.monotonic()
+        finally:
+            # Cancelled on disconnect: fail the presses in hand as well as the queued ones
+            if next_item:
+                futures.append(next_item[1])
+            _resolve(futures, JvcProjectorError("Projector disconnected"))
+            self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        """Fail key presses that were still queued when the writer stopped."""
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            _resolve([future], JvcProjectorError("Projector disconnected"))
+
+
+def _resolve(futures: list[asyncio.Future], err: Exception | None = None) -> None:
+    """Complete the futures of key presses that are still waiting, with err if given."""
+    for future in futures:
+        if future.done():
+            continue
+        if err is None:
+            future.set_result(None)
+        else:
+            future.set_exception(err)
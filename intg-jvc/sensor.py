@@ -53,7 +53,7 @@ class JVCSensor(SensorEntity):
 
         super().__init__(
             identifier=self._entity_id,
-            name=f"{sensor_config.name}",
+            name=sensor_config.name,
             features=[],
             attributes=attributes,
             device_class=DeviceClasses.CUSTOM,
@@ -0,0 +1,116 @@
+"""
+Helpers for the shared projector control session of the JVC integration driver.
+
+Retries requests that failed on a transient connection error and tunes the socket.
+"""
+
+import asyncio
+import logging
+import random
+import socket
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from jvcprojector.connection import Connection as JvcConnection
+from jvcprojector.error import (
+    JvcProjectorAuthError,
+    JvcProjectorError,
+    JvcProjectorReadWriteTimeoutError,
+)
+
+_LOG = logging.getLogger(__name__)
+
+TCP_KEEPALIVE_IDLE = 3
+TCP_KEEPALIVE_INTERVAL = 1
+TCP_KEEPALIVE_COUNT = 2
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 5.0
+
+
+def is_transient_error(err: Exception, idempotent: bool) -> bool:
+    """Return True if a failed request is safe and worthwhile to resend.
+
+    Read timeouts and socket errors can happen after the request was written, so
+    they are only retried for idempotent requests. Errors the library wraps while
+    connecting happen before anything is written. The library already retries
+    refused connections itself and raises a bare timeout error once it gives up;
+    that is not retried again here.
+    """
+    if isinstance(err, (JvcProjectorReadWriteTimeoutError, OSError)):
+        return idempotent
+    return isinstance(err.__cause__, (OSError, asyncio.TimeoutError))
+
+
+async def with_retry(name: str, func: Callable[..., Awaitable[Any]], *args: Any, idempotent: bool = True) -> Any:
+    """Run a client call, retrying transient failures with exponential backoff.
+
+    Authentication and command errors are raised immediately; retrying them
+    cannot succeed. Delays are jittered so several controllers reconnecting to a
+    projector that just power-cycled don't retry in lockstep.
+
+    Callers keep the projector lock for the whole call, backoff included, so
+    nothing else can reach the projector between a read and the write that
+    depends on it.
+    """
+    for attempt in range(RETRY_ATTEMPTS - 1):
+        try:
+            return await func(*args)
+        except JvcProjectorAuthError:
+            raise
+        except (JvcProjectorError, OSError) as err:
+            if not is_transient_error(err, idempotent):
+                raise
+            delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt) * (1 + random.random() * 0.5)
+            _LOG.debug(
+                "[%s] Transient error (%s), retrying in %.2fs (attempt %d/%d)",
+                name,
+                err,
+                delay,
+                attempt + 1,
+                RETRY_ATTEMPTS,
+            )
+            await asyncio.sleep(delay)
+    return await func(*args)
+
+
+def tune_new_connections(conn: JvcConnection, name: str) -> None:
+    """Apply socket options to the open connection and every one opened after it.
+
+    Requests are tiny request/response frames, so Nagle's algorithm only adds
+    delay. asyncio already disables it on its transports; set it explicitly so the
+    behaviour doesn't depend on the event loop implementation. TCP keepalive lets
+    a projector that vanished mid-session (e.g. switched off at the mains) fail
+    the next command quickly instead of waiting for the read timeout.
+
+    pyjvcprojector 2.0.6 has no hook for this: the client's Device keeps one
+    Connection whose connect() opens a new stream each time the session is
+    re-established. That connect() is wrapped on the given instance only, so the
+    options are set once per new socket and no other library user is affected.
+    """
+    open_connection = conn.connect
+
+    async def connect_and_tune() -> None:
+        await open_connection()
+        _tune_socket(conn, name)
+
+    conn.connect = connect_and_tune  # type: ignore[method-assign]
+    _tune_socket(conn, name)
+
+
+def _tune_socket(conn: JvcConnection, name: str) -> None:
+    """Set low-latency and dead-peer socket options on an open projector connection."""
+    writer = getattr(conn, "_writer", None)
+    sock = writer.get_extra_info("socket") if writer is not None else None
+    if sock is None:
+        return
+
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPALIVE_INTERVAL)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, TCP_KEEPALIVE_COUNT)
+    except OSError as err:
+        _LOG.debug("[%s] Failed to set socket options: %s", name, err)
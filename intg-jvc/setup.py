@@ -1,17 +1,117 @@
 """Module that includes all functions needed for the setup and reconfiguration process"""
 
+import asyncio
 import logging
 from ipaddress import ip_address
 from typing import Any
 
 from const import JVCConfig
 from jvcprojector import JvcProjector, command
-from jvcprojector.error import JvcProjectorError
+from jvcprojector.error import JvcProjectorError, JvcProjectorTimeoutError
 from ucapi import IntegrationSetupError, RequestUserInput, SetupError
 from ucapi_framework import BaseSetupFlow
 
 _LOG = logging.getLogger(__name__)
 
+# Long enough to wait out the driver's idle control session, short enough to fail fast on a wrong address
+SETUP_CONNECT_TIMEOUT = 10
+
+
+_NAME_FIELD = {
+    "field": {"text": {"value": ""}},
+    "id": "name",
+    "label": {
+        "en": "Projector Name",
+    },
+}
+_PASSWORD_FIELD = {
+    "field": {"text": {"value": ""}},
+    "id": "password",
+    "label": {
+        "en": "Password",
+    },
+}
+_USE_SENSORS_FIELD = {
+    "field": {"checkbox": {"value": True}},
+    "id": "use_sensors",
+    "label": {
+        "en": "Enable Sensors",
+    },
+}
+
+# Setup form fields are static, so they are built once instead of on every setup screen
+DISCOVERY_FIELDS = (_NAME_FIELD, _PASSWORD_FIELD, _USE_SENSORS_FIELD)
+MANUAL_ENTRY_FIELDS = (
+    {
+        "id": "info",
+        "label": {
+            "en": "Setup your JVC Projector",
+        },
+        "field": {
+            "label": {
+                "value": {
+                    "en": "Please supply the IP address or Hostname of your JVC Projector.",
+                }
+            }
+        },
+    },
+    _NAME_FIELD,
+    {
+        "field": {"text": {"value": ""}},
+        "id": "address",
+        "label": {
+            "en": "IP Address",
+        },
+    },
+    _PASSWORD_FIELD,
+    _USE_SENSORS_FIELD,
+)
+
+
+async def get_projector_metadata(address: str, password: str) -> tuple[str | None, str, str, list[str]]:
+    """
+    Return the MAC address, model, spec and capabilities of a projector.
+
+    Every call connects and authenticates, so an unreachable projector or a wrong
+    password always fails. All values are read over that one connection.
+
+    :param address: projector IP address
+    :param password: projector network password
+    :return: tuple of MAC address, model, spec and capability names
+    """
+    _LOG.debug("Creating JvcProjector instance for %s (password set: %s)", address, bool(password))
+    jvc = JvcProjector(address, password=password)
+    try:
+        _LOG.debug("Attempting jvc.connect() to %s", address)
+        try:
+            await asyncio.wait_for(jvc.connect(), timeout=SETUP_CONNECT_TIMEOUT)
+        except asyncio.TimeoutError as err:
+            raise JvcProjectorTimeoutError(f"Failed to connect to {address} within {SETUP_CONNECT_TIMEOUT}s") from err
+        _LOG.debug("jvc.connect() succeeded")
+
+        # Get MAC address, model, and spec from connected projector
+        model = jvc.model
+        _LOG.debug("Model: %s", model)
+
+        _LOG.debug("Requesting MAC address")
+        mac = await jvc.get(command.MacAddress)
+        _LOG.debug("MAC address: %s", mac)
+
+        spec = jvc.spec
+        _LOG.debug("Spec: %s", spec)
+
+        # Get capabilities to store in config
+        _LOG.debug("Requesting capabilities")
+        capabilities_dict = jvc.capabilities()
+        capabilities_list = list(capabilities_dict.keys()) if capabilities_dict else []
+        _LOG.debug("Capabilities: %d commands", len(capabilities_list))
+    finally:
+        _LOG.debug("Disconnecting from %s", address)
+        await jvc.disconnect()
+        _LOG.debug("Disconnected")
+
+    return mac, model, spec, capabilities_list
+
 
 class JVCSetupFlow(BaseSetupFlow[JVCConfig]):
     """
@@ -26,79 +126,10 @@ class JVCSetupFlow(BaseSetupFlow[JVCConfig]):
 
         :return: RequestUserInput with form fields for manual configuration
         """
-        return RequestUserInput(
-            {"en": "JVC Projector Setup"},
-            [
-                {
-                    "id": "info",
-                    "label": {
-                        "en": "Setup your JVC Projector",
-                    },
-                    "field": {
-                        "label": {
-                            "value": {
-                                "en": (
-                                    "Please supply the IP address or Hostname of your JVC Projector."
-                                ),
-                            }
-                        }
-                    },
-                },
-                {
-                    "field": {"text": {"value": ""}},
-                    "id": "name",
-                    "label": {
-                        "en": "Projector Name",
-                    },
-                },
-                {
-                    "field": {"text": {"value": ""}},
-                    "id": "address",
-                    "label": {
-                        "en": "IP Address",
-                    },
-                },
-                {
-                    "field": {"text": {"value": ""}},
-                    "id": "password",
-                    "label": {
-                        "en": "Password",
-                    },
-                },
-                {
-                    "field": {"checkbox": {"value": True}},
-                    "id": "use_sensors",
-                    "label": {
-                        "en": "Enable Sensors",
-                    },
-                },
-            ],
-        )
+        return RequestUserInput({"en": "JVC Projector Setup"}, list(MANUAL_ENTRY_FIELDS))
 
     def get_additional_discovery_fields(self) -> list[dict]:
-        return [
-            {
-                "field": {"text": {"value": ""}},
-                "id": "name",
-                "label": {
-                    "en": "Projector Name",
-                },
-            },
-            {
-                "field": {"text": {"value": ""}},
-                "id": "password",
-                "label": {
-                    "en": "Password",
-                },
-            },
-            {
-                "field": {"checkbox": {"value": True}},
-                "id": "use_sensors",
-                "label": {
-                    "en": "Enable Sensors",
-                },
-            },
-        ]
+        return list(DISCOVERY_FIELDS)
 
     async def query_device(
         self, input_values: dict[str, Any]
@@ -111,12 +142,9 @@ class JVCSetupFlow(BaseSetupFlow[JVCConfig]):
         """
         address = input_values.get("address", "").strip()
         password = input_values.get("password", "").strip()
-        name = (input_values.get("name", "")).strip()
+        name = input_values.get("name", "").strip() or "JVC Projector"
         use_sensors = input_values.get("use_sensors", True)
 
-        if not name or name == "":
-            name = "JVC Projector"
-
         if not address:
             # Re-display the form if address is missing
             _LOG.warning("Address is required, re-displaying form")
@@ -132,35 +160,7 @@ class JVCSetupFlow(BaseSetupFlow[JVCConfig]):
             return self.get_manual_entry_form()
 
         try:
-            _LOG.debug("Creating JvcProjector instance for %s (password set: %s)", address, bool(password))
-            jvc = JvcProjector(address, password=password)
-            try:
-                _LOG.debug("Attempting jvc.connect() to %s", address)
-                await jvc.connect()
-                _LOG.debug("jvc.connect() succeeded")
-
-                # Get MAC address, model, and spec from connected projector
-                _LOG.debug("Requesting MAC address")
-                mac = await jvc.get(command.MacAddress)
-                _LOG.debug("MAC address: %s", mac)
-
-                model = jvc.model
-                _LOG.debug("Model: %s", model)
-
-                spec = jvc.spec
-                _LOG.debug("Spec: %s", spec)
-
-                # Get capabilities to store in config
-                _LOG.debug("Requesting capabilities")
-                capabilities_dict = jvc.capabilities()
-                capabilities_list = (
-                    list(capabilities_dict.keys()) if capabilities_dict else []
-                )
-                _LOG.debug("Capabilities: %d commands", len(capabilities_list))
-            finally:
-                _LOG.debug("Disconnecting from %s", address)
-                await jvc.disconnect()
-                _LOG.debug("Disconnected")
+            mac, model, spec, capabilities_list = await get_projector_metadata(address, password)
             _LOG.debug("JVC Projector MAC: %s, Model: %s, Spec: %s", mac, model, spec)
 
             return JVCConfig(